@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, Callable, Sequence  # noqa: UP035
@@ -47,11 +48,25 @@ def _emit_json(payload: Any) -> None:
     typer.echo(json.dumps(payload, ensure_ascii=False))
 
 
+_NEEDS_ESCAPE_RE = re.compile(r"[\\\x00-\x1f\x7f]")
+
+_CTRL_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\x7f": "\\x7f",
+        **{chr(code): f"\\x{code:02x}" for code in range(0x20) if code not in (9, 10, 13)},
+    },
+)
+
+
 def _format_command(parts: Sequence[str]) -> str:
     """Render a command sequence with escaped control characters."""
 
     def _format_part(part: str) -> str:
-        escaped = part.encode("unicode_escape").decode("ascii")
+        escaped = part.translate(_CTRL_ESCAPES) if _NEEDS_ESCAPE_RE.search(part) else part
         if any(char.isspace() for char in part):
             escaped = escaped.replace('"', r"\"")
             return f'"{escaped}"'
@@ -103,7 +118,7 @@ def _prepare_context(
 
 def _build_plan_payload(context: WorkflowContext) -> PlanComputation:
     """Return the repo state, available actions, and plan for ``context``."""
-    state = context.observer.observe()
+    state = context.state_cache.get()
     actions = build_action_specs(state, context.config)
     plan = context.planner.plan(state, context.config.goal, actions)
     return PlanComputation(state=state, actions=actions, plan=plan)
@@ -222,7 +237,7 @@ def _execute_workflow(context: WorkflowContext) -> dict[str, Any]:
     runner = context.build_action_runner()
     executor = Executor(
         planner=context.planner,
-        observer=context.observer.observe,
+        observer=context.state_cache.get,
         runner=runner,
         available_actions=computation.actions,
         goal=context.config.goal,
@@ -14,6 +14,7 @@ from goapgit.actions import (
     ensure_clean_or_stash,
     rebase_continue_or_abort,
 )
+from goapgit.core.cache import RepoStateCache
 from goapgit.core.explain import ActionContext
 from goapgit.core.models import ActionSpec, Config, GoalSpec, RepoState, StrategyRule
 from goapgit.core.planner import SimplePlanner
@@ -38,6 +39,7 @@ class WorkflowContext:
     observer_facade: GitFacade
     observer: RepoObserver
     planner: SimplePlanner
+    state_cache: RepoStateCache
 
     def build_action_runner(
         self,
@@ -63,6 +65,8 @@ class WorkflowContext:
             except Exception as error:  # pragma: no cover - defensive logging
                 self.logger.error("unexpected action failure", action=action.name, error=str(error))
                 return False
+            finally:
+                self.state_cache.invalidate()
 
             return bool(result)
 
@@ -104,6 +108,7 @@ def build_workflow_context(
     action_facade = GitFacade(repo_path=repo_path, logger=logger, dry_run=dry_run_actions)
     observer = RepoObserver(observer_facade)
     planner = SimplePlanner()
+    state_cache = RepoStateCache(observer.observe)
     return WorkflowContext(
         repo_path=repo_path,
         config=config,
@@ -112,6 +117,7 @@ def build_workflow_context(
         observer_facade=observer_facade,
         observer=observer,
         planner=planner,
+        state_cache=state_cache,
     )
 
 
@@ -221,7 +227,7 @@ def _build_apply_strategy_context(config: Config) -> ActionContext | None:
 
 
 def _run_apply_strategy(context: WorkflowContext, _: ActionSpec) -> bool:
-    state = context.observer.observe()
+    state = context.state_cache.get()
     apply_path_strategy(
         context.action_facade,
         context.logger,
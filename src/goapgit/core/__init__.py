@@ -1,5 +1,6 @@
 """Core GOAP components for goapgit."""
 
+from .cache import RepoStateCache
 from .executor import ActionRunner, ExecutionResult, Executor, StateObserver
 from .models import (
     ActionSpec,
@@ -30,6 +31,7 @@ __all__ = [
     "Plan",
     "RepoRef",
     "RepoState",
+    "RepoStateCache",
     "RiskLevel",
     "SimplePlanner",
     "StateObserver",
@@ -0,0 +1,37 @@
+"""Caching helpers for repository state observation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from .executor import StateObserver
+    from .models import RepoState
+
+
+class RepoStateCache:
+    """Memoise the most recent :class:`RepoState` observation.
+
+    Planning and execution both need the current repository state, and
+    each observation shells out to ``git status``. The cache returns the
+    last observed state until :meth:`invalidate` is called after a
+    mutating action, collapsing redundant status subprocesses.
+    """
+
+    def __init__(self, observer: StateObserver) -> None:
+        """Wrap ``observer`` so repeated reads reuse the last observation."""
+        self._observer = observer
+        self._state: RepoState | None = None
+
+    def get(self) -> RepoState:
+        """Return the cached state, observing the repository if stale."""
+        if self._state is None:
+            self._state = self._observer()
+        return self._state
+
+    def invalidate(self) -> None:
+        """Discard the cached state so the next read observes afresh."""
+        self._state = None
+
+
+__all__ = ["RepoStateCache"]
@@ -92,7 +92,7 @@ class GoalSpec(BaseModel):
     tests_must_pass: bool = False
     push_with_lease: bool = False
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class ActionSpec(BaseModel):
@@ -123,7 +123,7 @@ class StrategyRule(BaseModel):
     resolution: str
     when: str | None = None
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 def _empty_strategy_rules() -> list[StrategyRule]:
@@ -141,7 +141,7 @@ class Config(BaseModel):
     dry_run: bool = True
     max_test_runtime_sec: int = 600
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 __all__ = [
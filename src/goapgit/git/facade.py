@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import subprocess
 from pathlib import Path
@@ -200,16 +201,31 @@ def _filter_runner_kwargs(
     kwargs: dict[str, object],
 ) -> dict[str, object]:
     """Limit keyword arguments to those supported by the runner callable."""
+    accepted = _accepted_runner_kwargs(runner)
+    if accepted is None:
+        return kwargs
+    return {name: value for name, value in kwargs.items() if name in accepted}
+
+
+@functools.cache
+def _accepted_runner_kwargs(
+    runner: Callable[..., subprocess.CompletedProcess[str]],
+) -> frozenset[str] | None:
+    """Return the keyword names ``runner`` accepts, or ``None`` for any.
+
+    Signature inspection is comparatively expensive, so the result is
+    memoised per runner callable rather than recomputed on every git
+    command.
+    """
     try:
         signature = inspect.signature(runner)
     except (TypeError, ValueError):
-        return kwargs
+        return None
     parameters = tuple(signature.parameters.values())
     if any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters):
-        return kwargs
-    accepted = {
+        return None
+    return frozenset(
         parameter.name
         for parameter in parameters
         if parameter.kind in {inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY}
-    }
-    return {name: value for name, value in kwargs.items() if name in accepted}
+    )
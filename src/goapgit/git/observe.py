@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, ClassVar, Protocol
 
 from goapgit.core.models import (
     ConflictDetail,
@@ -13,6 +13,8 @@ from goapgit.core.models import (
 from goapgit.git.parse import parse_conflict_markers
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from goapgit.git.facade import GitFacade
 
 _STATUS_COMMAND = [
@@ -23,7 +25,7 @@ _STATUS_COMMAND = [
     "--show-stash",
 ]
 
-_MIN_BRANCH_AB_TOKENS = 3
+_MIN_BRANCH_AB_TOKENS = 2
 _CONFLICT_FLAG = "U"
 
 
@@ -121,28 +123,45 @@ class _PorcelainAccumulator:
     conflicts: list[ConflictDetail] = field(default_factory=_empty_conflicts)
 
     def handle_header(self, header: str) -> None:
-        if header.startswith("branch.head "):
-            self.branch = header.split(" ", 1)[1]
-        elif header.startswith("branch.upstream "):
-            self.tracking = header.split(" ", 1)[1]
-        elif header.startswith("branch.oid "):
-            sha_value = header.split(" ", 1)[1]
-            self.sha = None if sha_value == "(initial)" else sha_value
-        elif header.startswith("branch.ab "):
-            tokens = header.split()
-            if len(tokens) >= _MIN_BRANCH_AB_TOKENS:
-                self.ahead = int(tokens[1].lstrip("+"))
-                self.behind = int(tokens[2].lstrip("-"))
-        elif header.startswith("stash "):
-            try:
-                self.stash_entries = int(header.split(" ", 1)[1])
-            except ValueError:
-                self.stash_entries = 0
-        elif header.startswith("rebase"):
+        keyword, separator, value = header.partition(" ")
+        handler = self._HEADER_HANDLERS.get(keyword)
+        if handler is not None:
+            if separator:
+                handler(self, value)
+        elif keyword.startswith("rebase"):
             self.ongoing_rebase = True
-        elif header.startswith("merge"):
+        elif keyword.startswith("merge"):
             self.ongoing_merge = True
 
+    def _set_branch(self, value: str) -> None:
+        self.branch = value
+
+    def _set_tracking(self, value: str) -> None:
+        self.tracking = value
+
+    def _set_sha(self, value: str) -> None:
+        self.sha = None if value == "(initial)" else value
+
+    def _set_ahead_behind(self, value: str) -> None:
+        tokens = value.split()
+        if len(tokens) >= _MIN_BRANCH_AB_TOKENS:
+            self.ahead = int(tokens[0].lstrip("+"))
+            self.behind = int(tokens[1].lstrip("-"))
+
+    def _set_stash_entries(self, value: str) -> None:
+        try:
+            self.stash_entries = int(value)
+        except ValueError:
+            self.stash_entries = 0
+
+    _HEADER_HANDLERS: ClassVar[dict[str, Callable[[_PorcelainAccumulator, str], None]]] = {
+        "branch.head": _set_branch,
+        "branch.upstream": _set_tracking,
+        "branch.oid": _set_sha,
+        "branch.ab": _set_ahead_behind,
+        "stash": _set_stash_entries,
+    }
+
     def handle_entry(
         self,
         repo_path: Path,
@@ -188,7 +207,7 @@ class _PorcelainAccumulator:
     ) -> None:
         self.working_tree_dirty = True
         _, _, remainder = line.partition("\t")
-        path = remainder.split("\0", 1)[0] if remainder else line.split(" ")[-1]
+        path = remainder.split("\0", 1)[0] if remainder else line.rpartition(" ")[2]
         self.conflicts.append(conflict_parser(repo_path, path))
 
     def to_summary(self) -> StatusSummary:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import re
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+_MERGE_TREE_CONFLICT_RE = re.compile(r"^\s*CONFLICT.* in (.+?)\s*$", re.MULTILINE)
+
 
 def parse_conflict_markers(repo_path: Path, path: str) -> ConflictDetail:
     """Inspect a conflicted file and estimate hunk count and conflict type."""
@@ -47,17 +51,19 @@ def parse_conflict_markers(repo_path: Path, path: str) -> ConflictDetail:
 
     hunk_count = 0
     try:
-        with resolved_path.open("r", encoding="utf-8", errors="ignore") as handle:
-            for line in handle:
-                if line.startswith("<<<<<<<"):
-                    hunk_count += 1
+        data = resolved_path.read_bytes()
     except OSError as exc:
         LOGGER.warning(
             "Failed to read conflict markers from %s: %s",
             path,
             exc,
         )
-        hunk_count = 0
+    else:
+        hunk_count = min(
+            data.count(b"\n<<<<<<<") + data.startswith(b"<<<<<<<"),
+            data.count(b"\n=======") + data.startswith(b"======="),
+            data.count(b"\n>>>>>>>") + data.startswith(b">>>>>>>"),
+        )
 
     return ConflictDetail(path=path, hunk_count=hunk_count, ctype=conflict_type)
 
@@ -86,41 +92,66 @@ def _path_contains_symlink(target: Path, root: Path) -> bool:
         current = parent
 
 
+_SUFFIX_TO_TYPE: dict[str, ConflictType] = {
+    ".json": ConflictType.json,
+    ".yaml": ConflictType.yaml,
+    ".yml": ConflictType.yaml,
+    ".lock": ConflictType.lock,
+}
+
+
 def _detect_conflict_type(path: str) -> ConflictType:
-    lowered = path.lower()
-    if lowered.endswith(".json"):
-        return ConflictType.json
-    if lowered.endswith((".yaml", ".yml")):
-        return ConflictType.yaml
-    if lowered.endswith(".lock"):
-        return ConflictType.lock
-    return ConflictType.text
+    dot = path.rfind(".")
+    if dot == -1:
+        return ConflictType.text
+    return _SUFFIX_TO_TYPE.get(path[dot:].lower(), ConflictType.text)
 
 
 def parse_merge_tree_conflicts(output: str) -> set[str]:
     """Parse `git merge-tree --write-tree` output into a conflict set."""
-    conflicts: set[str] = set()
-    for line in output.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.startswith("CONFLICT") and " in " in stripped:
-            _, path = stripped.rsplit(" in ", 1)
-            conflicts.add(path.strip())
-    return conflicts
+    if "CONFLICT" not in output:
+        return set()
+    return set(_MERGE_TREE_CONFLICT_RE.findall(output))
+
+
+_prediction_caches: weakref.WeakKeyDictionary[GitFacade, dict[tuple[str, str], set[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _resolve_oid(facade: GitFacade, rev: str) -> str | None:
+    """Resolve ``rev`` to a commit oid, returning ``None`` on failure."""
+    result = facade.run(["git", "rev-parse", "--verify", rev], capture_output=True, check=False)
+    if result.returncode != 0:
+        return None
+    return (result.stdout or "").strip() or None
 
 
 def predict_merge_conflicts(
     facade: GitFacade, ours: str, theirs: str,
 ) -> set[str]:
-    """Run git merge-tree and predict the conflicted paths."""
+    """Run git merge-tree and predict the conflicted paths.
+
+    The result is deterministic in the two commit oids, so it is
+    memoised per facade to avoid repeating the expensive merge-tree
+    subprocess when the same tips are queried again during planning.
+    """
+    ours_oid = _resolve_oid(facade, ours)
+    theirs_oid = _resolve_oid(facade, theirs)
+    cache = _prediction_caches.setdefault(facade, {})
+    key = (ours_oid or ours, theirs_oid or theirs)
+    if ours_oid is not None and theirs_oid is not None and key in cache:
+        return set(cache[key])
     result = facade.run(
         ["git", "merge-tree", "--write-tree", ours, theirs],
         capture_output=True,
         check=False,
     )
     stdout = result.stdout or ""
-    return parse_merge_tree_conflicts(stdout)
+    conflicts = parse_merge_tree_conflicts(stdout)
+    if ours_oid is not None and theirs_oid is not None:
+        cache[key] = set(conflicts)
+    return conflicts
 
 
 __all__ = [
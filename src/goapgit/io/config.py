@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import tomllib
 from collections.abc import Mapping as MappingABC
 from pathlib import Path
 from typing import Any, cast
 from collections.abc import Mapping
 
+from pydantic import TypeAdapter
+
 from goapgit.core.models import Config
 
+_CONFIG_ADAPTER = TypeAdapter(Config)
+
+_CacheKey = tuple[str, int, int, Any]
+_config_cache: dict[_CacheKey, Config] = {}
+
 
 def load_config(
     *,
@@ -28,6 +36,7 @@ def load_config(
         raise ValueError(msg)
 
     raw_content: dict[str, Any]
+    cache_key: _CacheKey | None = None
     if path is not None:
         path = Path(path)
         if not path.exists():
@@ -36,12 +45,19 @@ def load_config(
             msg = f"Configuration path '{path}' is not a file."
             raise ValueError(msg)
         try:
-            text = path.read_text()
+            stat = path.stat()
+            cache_key = (os.fspath(path.resolve()), stat.st_mtime_ns, stat.st_size, _freeze(overrides))
+        except OSError:
+            cache_key = None
+        if cache_key is not None and (cached := _config_cache.get(cache_key)) is not None:
+            return cached
+        try:
+            raw_bytes = path.read_bytes()
         except OSError as error:
             reason = getattr(error, "strerror", None) or str(error)
             msg = f"Failed to read configuration file at '{path}': {reason}"
             raise ValueError(msg) from error
-        raw_content = tomllib.loads(text)
+        raw_content = tomllib.loads(raw_bytes.decode("utf-8"))
     else:
         if data is None:
             msg = "Configuration data must be provided when path is omitted."
@@ -50,26 +66,46 @@ def load_config(
         raw_content = tomllib.loads(text)
 
     if overrides is not None:
-        typed_overrides: dict[str, Any] = {str(key): value for key, value in overrides.items()}
-        raw_content = _merge_dicts(dict(raw_content), typed_overrides)
+        raw_content = _apply_overrides(dict(raw_content), overrides)
 
     normalised = _normalise(raw_content)
 
-    return Config.model_validate(normalised)
-
-
-def _merge_dicts(base: dict[str, Any], updates: Mapping[str, Any]) -> dict[str, Any]:
-    for key, value in updates.items():
-        if (
-            key in base
-            and isinstance(base[key], MappingABC)
-            and isinstance(value, MappingABC)
-        ):
-            nested_base = cast("dict[str, Any]", dict(base[key]))
-            nested_updates = cast("Mapping[str, Any]", value)
-            base[key] = _merge_dicts(nested_base, nested_updates)
+    config = _CONFIG_ADAPTER.validate_python(normalised)
+    if cache_key is not None:
+        _config_cache[cache_key] = config
+    return config
+
+
+def clear_config_cache() -> None:
+    """Drop every memoised configuration, forcing fresh parses."""
+    _config_cache.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert ``value`` into a hashable form usable in cache keys."""
+    if isinstance(value, MappingABC):
+        typed_mapping = cast("Mapping[Any, Any]", value)
+        return tuple(sorted((str(key), _freeze(item)) for key, item in typed_mapping.items()))
+    if isinstance(value, (list, tuple)):
+        typed_sequence = cast("tuple[Any, ...]", tuple(value))
+        return tuple(_freeze(item) for item in typed_sequence)
+    if isinstance(value, (set, frozenset)):
+        typed_set = cast("frozenset[Any]", frozenset(value))
+        return frozenset(_freeze(item) for item in typed_set)
+    return value
+
+
+def _apply_overrides(base: dict[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
+    """Merge one level of ``overrides`` sections into ``base``."""
+    for key, value in overrides.items():
+        name = str(key)
+        existing = base.get(name)
+        if isinstance(existing, MappingABC) and isinstance(value, MappingABC):
+            section = dict(cast("Mapping[str, Any]", existing))
+            section.update(cast("Mapping[str, Any]", value))
+            base[name] = section
         else:
-            base[key] = value
+            base[name] = value
     return base
 
 
@@ -96,4 +132,4 @@ def _normalise(raw: Mapping[str, Any]) -> dict[str, Any]:
     return config_dict
 
 
-__all__ = ["load_config"]
+__all__ = ["clear_config_cache", "load_config"]
@@ -2,38 +2,38 @@
 
 from __future__ import annotations
 
+import importlib
 import json
+from collections import deque
 from collections.abc import Mapping as MappingABC
 from datetime import datetime, UTC
 import re
 from typing import Any, TextIO, cast
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 
-from pydantic import BaseModel, SecretStr, field_validator
+_JsonEncoder = Callable[[Any], bytes]
+_orjson_module = None
+try:  # pragma: no cover - optional dependency
+    _orjson_module = importlib.import_module("orjson")
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    _orjson_dumps: _JsonEncoder | None = None
+else:  # pragma: no cover - optional dependency
+    _orjson_dumps = cast("_JsonEncoder | None", getattr(_orjson_module, "dumps", None))
 
 
-class _SanitizedText(BaseModel):
-    """Model that normalises sensitive fragments in log text."""
+_TEXT_LINE_FMT = "[%s] %-7s %s: %s"
 
-    text: SecretStr
-
-    @field_validator("text", mode="before")
-    @classmethod
-    def _mask_sensitive_data(cls, value: Any) -> str:
-        text = str(value)
-        patterns = [
-            (r"https://[^:]+:[^@]+@", "https://***:***@"),
-            (r"token[=:]\s*\S+", "token=***"),
-        ]
-        for pattern, replacement in patterns:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        return text
+_URL_CREDENTIALS_RE = re.compile(r"https://[^:]+:[^@]+@", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"token[=:]\s*\S+", re.IGNORECASE)
 
 
 def _sanitize_log_output(text: str) -> str:
     """Mask sensitive fragments in the provided text."""
-    sanitized = _SanitizedText.model_validate({"text": text})
-    return sanitized.text.get_secret_value()
+    if "://" in text:
+        text = _URL_CREDENTIALS_RE.sub("https://***:***@", text)
+    if "token" in text.lower():
+        text = _TOKEN_RE.sub("token=***", text)
+    return text
 
 
 def _sanitize_log_value(value: Any) -> Any:
@@ -41,11 +41,7 @@ def _sanitize_log_value(value: Any) -> Any:
     if isinstance(value, str):
         return _sanitize_log_output(value)
     if isinstance(value, MappingABC):
-        typed_mapping = cast("Mapping[Any, Any]", value)
-        sanitised_mapping: dict[Any, Any] = {}
-        for key, item in typed_mapping.items():
-            sanitised_mapping[key] = _sanitize_log_value(item)
-        return sanitised_mapping
+        return _sanitize_mapping(cast("Mapping[Any, Any]", value))
     if isinstance(value, tuple):
         typed_tuple = cast("tuple[Any, ...]", value)
         return tuple(_sanitize_log_value(item) for item in typed_tuple)
@@ -58,6 +54,22 @@ def _sanitize_log_value(value: Any) -> Any:
     return value
 
 
+def _sanitize_mapping(root: Mapping[Any, Any]) -> dict[Any, Any]:
+    """Sanitise nested mappings iteratively instead of frame-per-level."""
+    sanitised_root: dict[Any, Any] = {}
+    queue: deque[tuple[Mapping[Any, Any], dict[Any, Any]]] = deque([(root, sanitised_root)])
+    while queue:
+        source, target = queue.popleft()
+        for key, item in source.items():
+            if isinstance(item, MappingABC):
+                nested: dict[Any, Any] = {}
+                target[key] = nested
+                queue.append((cast("Mapping[Any, Any]", item), nested))
+            else:
+                target[key] = _sanitize_log_value(item)
+    return sanitised_root
+
+
 class StructuredLogger:
     """Simple structured logger supporting JSON lines and text output."""
 
@@ -66,6 +78,14 @@ class StructuredLogger:
         self._name = name
         self._json_mode = json_mode
         self._stream: TextIO = stream or _default_stream()
+        self._silent = False
+
+    @classmethod
+    def null(cls) -> StructuredLogger:
+        """Return a logger that discards every record without formatting it."""
+        logger = cls(name="null")
+        logger._silent = True
+        return logger
 
     @property
     def name(self) -> str:
@@ -94,6 +114,8 @@ class StructuredLogger:
         self._emit("ERROR", message, fields)
 
     def _emit(self, level: str, message: str, fields: dict[str, Any]) -> None:
+        if self._silent:
+            return
         timestamp = datetime.now(UTC).isoformat()
         sanitised_message = _sanitize_log_output(message)
         sanitised_fields = {key: _sanitize_log_value(value) for key, value in fields.items()}
@@ -105,15 +127,19 @@ class StructuredLogger:
                 "message": sanitised_message,
             }
             payload.update(sanitised_fields)
-            self._stream.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            if _orjson_dumps is not None:
+                serialised = _orjson_dumps(payload).decode()
+            else:
+                serialised = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            self._stream.writelines((serialised, "\n"))
         else:
-            line = f"[{timestamp}] {level:<7} {self._name}: {sanitised_message}"
+            line = _TEXT_LINE_FMT % (timestamp, level, self._name, sanitised_message)
             if sanitised_fields:
                 extras = " ".join(
                     f"{key}={json.dumps(value, ensure_ascii=False)}" for key, value in sanitised_fields.items()
                 )
                 line = f"{line} | {extras}"
-            self._stream.write(line + "\n")
+            self._stream.writelines((line, "\n"))
         self._stream.flush()
 
 
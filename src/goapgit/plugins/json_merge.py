@@ -5,6 +5,8 @@ from __future__ import annotations
 import argparse
 import importlib
 import json
+import os
+import stat
 from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
@@ -14,6 +16,8 @@ from collections.abc import Callable, Sequence as TypingSequence
 
 _MISSING = object()
 
+_TEXTUAL_TYPES = (str, bytes, bytearray)
+
 _YamlFactory = Callable[..., Any]
 _yaml_module = None
 try:  # pragma: no cover - optional dependency
@@ -23,6 +27,8 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency
 else:  # pragma: no cover - optional dependency
     _yaml_factory = cast("_YamlFactory | None", getattr(_yaml_module, "YAML", None))
 
+_yaml_loader = None if _yaml_factory is None else _yaml_factory(typ="safe")
+
 
 class _YamlLoader(Protocol):
     def load(self, stream: Any) -> Any:  # pragma: no cover - protocol definition
@@ -33,7 +39,7 @@ class MergeError(RuntimeError):
     """Raised when a structured merge cannot be completed cleanly."""
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class MergeInputs:
     """Container for merge driver file paths."""
 
@@ -49,10 +55,20 @@ def merge_structured_documents(inputs: MergeInputs) -> bool:
         _ensure_safe_path(inputs.current, "current")
         _ensure_safe_path(inputs.base, "base", allow_missing=True)
         _ensure_safe_path(inputs.other, "other", allow_missing=True)
-        original = inputs.current.read_text(encoding="utf-8")
-        base = _load_document(inputs.base) if inputs.base.exists() else _MISSING
-        current = _load_document(inputs.current)
-        other = _load_document(inputs.other) if inputs.other.exists() else _MISSING
+        current_bytes = inputs.current.read_bytes()
+        original = current_bytes.decode("utf-8")
+        base_bytes = _read_optional_bytes(inputs.base)
+        other_bytes = _read_optional_bytes(inputs.other)
+        if other_bytes is not None and current_bytes == other_bytes:
+            return True
+        if other_bytes is not None and base_bytes == current_bytes:
+            inputs.current.write_bytes(other_bytes)
+            return True
+        if base_bytes is not None and base_bytes == other_bytes:
+            return True
+        base = _parse_document(base_bytes, inputs.base) if base_bytes is not None else _MISSING
+        current = _parse_document(current_bytes, inputs.current)
+        other = _parse_document(other_bytes, inputs.other) if other_bytes is not None else _MISSING
         merged = _merge_values(base, current, other)
     except MergeError:
         if original is not None:
@@ -84,27 +100,37 @@ def main(argv: TypingSequence[str] | None = None) -> int:
     return 0 if success else 1
 
 
-def _load_document(path: Path) -> Any:
-    text = path.read_text(encoding="utf-8")
+def _read_optional_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _parse_document(raw: bytes, path: Path) -> Any:
     try:
-        return json.loads(text)
+        return json.loads(raw)
     except json.JSONDecodeError as error:
-        if _yaml_factory is None:
+        if _yaml_loader is None:
             message = f"invalid JSON document: {path}"
             raise MergeError(message) from error
-        yaml_loader = cast("_YamlLoader", _yaml_factory(typ="safe"))
-        data = yaml_loader.load(text)
+        data = cast("_YamlLoader", _yaml_loader).load(raw.decode("utf-8"))
         return _normalise(data)
 
 
 def _write_document(path: Path, data: Any) -> None:
     normalised = _normalise(data)
-    formatted = json.dumps(normalised, indent=2, ensure_ascii=False, sort_keys=False)
-    path.write_text(f"{formatted}\n", encoding="utf-8")
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(normalised, handle, indent=2, ensure_ascii=False, sort_keys=False)
+        handle.write("\n")
 
 
 def _ensure_safe_path(path: Path, role: str, *, allow_missing: bool = False) -> None:
-    if path.is_symlink():
+    try:
+        mode = os.lstat(path).st_mode
+    except OSError:
+        mode = None
+    if mode is not None and stat.S_ISLNK(mode):
         message = f"refusing to use symlinked {role} document: {path}"
         raise MergeError(message)
     resolved = path.resolve()
@@ -112,7 +138,7 @@ def _ensure_safe_path(path: Path, role: str, *, allow_missing: bool = False) ->
     if not resolved.is_relative_to(cwd):
         message = f"{role} document outside working tree: {path}"
         raise MergeError(message)
-    if not path.exists():
+    if mode is None:
         if allow_missing:
             return
         message = f"missing {role} document: {path}"
@@ -126,7 +152,7 @@ def _normalise(value: Any) -> Any:
         for key, nested in mapping.items():
             ordered[str(key)] = _normalise(nested)
         return ordered
-    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+    if isinstance(value, Sequence) and not isinstance(value, _TEXTUAL_TYPES):
         sequence = cast("Sequence[Any]", value)
         return [_normalise(item) for item in sequence]
     return value
@@ -195,16 +221,20 @@ def _merge_mappings(base: Mapping[str, Any], ours: Mapping[str, Any], theirs: Ma
 
 def _merge_sequences(base: Any, ours: Sequence[Any], theirs: Sequence[Any]) -> Sequence[Any]:
     base_seq: Sequence[Any] | object = base if _is_sequence(base) else _MISSING
-    if base_seq is _MISSING and _equal(ours, theirs):
+    if base_seq is _MISSING and _sequences_equal(ours, theirs):
         return ours
-    if base_seq is not _MISSING and _equal(ours, cast("Sequence[Any]", base_seq)):
+    if base_seq is not _MISSING and _sequences_equal(ours, cast("Sequence[Any]", base_seq)):
         return theirs
-    if base_seq is not _MISSING and _equal(theirs, cast("Sequence[Any]", base_seq)):
+    if base_seq is not _MISSING and _sequences_equal(theirs, cast("Sequence[Any]", base_seq)):
         return ours
     message = "conflicting list modifications"
     raise MergeError(message)
 
 
+def _sequences_equal(left: Sequence[Any], right: Sequence[Any]) -> bool:
+    return len(left) == len(right) and _equal(left, right)
+
+
 def _merge_missing_branches(base: Any, ours: Any, theirs: Any) -> Any:
     ours_missing = ours is _MISSING
     theirs_missing = theirs is _MISSING
@@ -226,11 +256,11 @@ def _merge_missing_branches(base: Any, ours: Any, theirs: Any) -> Any:
 
 
 def _equal(left: Any, right: Any) -> bool:
-    return left == right
+    return left is right or bool(left == right)
 
 
 def _is_sequence(value: Any) -> bool:
-    return isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray))
+    return isinstance(value, Sequence) and not isinstance(value, _TEXTUAL_TYPES)
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI
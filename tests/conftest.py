@@ -1,5 +1,6 @@
 """Shared fixtures for the goapgit test suite."""
 from __future__ import annotations
+import shutil
 import subprocess
 from collections import deque
 from dataclasses import dataclass
@@ -12,6 +13,9 @@ if TYPE_CHECKING:
 import pytest
 from goapgit.git.facade import GitCommandError
 
+_DRY_RUN_RESULT = subprocess.CompletedProcess((), 0, stdout="", stderr="")
+
+
 @dataclass(frozen=True)
 class GitResponse:
     """Represents a scripted response for a git command."""
@@ -20,17 +24,25 @@ class GitResponse:
     stderr: str = ""
     returncode: int = 0
 
+@dataclass(frozen=True)
+class RepeatResponse:
+    """Wraps a response replayed for every invocation of a command."""
+
+    response: GitResponse
+
 class ScriptQueue:
     """Queue managing scripted git responses for :class:`FakeGitFacade`."""
 
     def __init__(self) -> None:
         """Initialise an empty script queue."""
         self._scripts: deque[dict[tuple[str, ...], deque[GitResponse]]] = deque()
-    def push(self, script: dict[tuple[str, ...], list[GitResponse] | GitResponse]) -> None:
+    def push(self, script: dict[tuple[str, ...], list[GitResponse] | GitResponse | RepeatResponse]) -> None:
         """Append a new script that will be consumed by the next facade instance."""
         prepared: dict[tuple[str, ...], deque[GitResponse]] = {}
         for command, responses in script.items():
-            if isinstance(responses, GitResponse):
+            if isinstance(responses, RepeatResponse):
+                prepared[command] = deque([responses.response])
+            elif isinstance(responses, GitResponse):
                 prepared[command] = deque([responses])
             else:
                 prepared[command] = deque(responses)
@@ -86,10 +98,9 @@ class FakeGitFacade:
     ) -> subprocess.CompletedProcess[str]:
         """Execute a git command using the scripted responses."""
         del timeout, capture_output  # unused but kept for parity with real facade
-        command = tuple(str(part) for part in args)
+        command = args if isinstance(args, tuple) else tuple(map(str, args))
         working_dir = Path(cwd) if cwd is not None else self._repo_path
         if self._dry_run:
-            completed = subprocess.CompletedProcess(command, 0, stdout="", stderr="")
             self._command_history.append(
                 {
                     "command": list(command),
@@ -98,7 +109,7 @@ class FakeGitFacade:
                     "dry_run": True,
                 },
             )
-            return completed
+            return _DRY_RUN_RESULT
         response = self._resolve_response(command)
         completed = subprocess.CompletedProcess(
             command,
@@ -177,11 +188,18 @@ class FakeGitFacade:
         return self.run(command)
     def _resolve_response(self, command: tuple[str, ...]) -> GitResponse:
         """Retrieve the scripted response for ``command``."""
-        if command not in self._script:
+        responses = self._script.get(command)
+        if responses is None:
             message = f"Unexpected git command: {command}"
             raise AssertionError(message)
-        responses = self._script[command]
         return responses.popleft() if len(responses) > 1 else responses[0]
+@pytest.fixture(scope="session")
+def git_executable() -> str:
+    """Locate the git executable once per session, skipping when absent."""
+    executable = shutil.which("git")
+    if executable is None:
+        pytest.skip("git executable not available")
+    return executable
 @pytest.fixture
 def configure_fake_git_facade(monkeypatch: pytest.MonkeyPatch) -> Iterator[ScriptQueue]:
     """Patch :class:`GitFacade` with a scripted fake for tests."""
@@ -191,4 +209,4 @@ def configure_fake_git_facade(monkeypatch: pytest.MonkeyPatch) -> Iterator[Scrip
     yield queue
     queue.clear()
     FakeGitFacade.script_queue = None
-__all__ = ["FakeGitFacade", "GitResponse", "ScriptQueue"]
+__all__ = ["FakeGitFacade", "GitResponse", "RepeatResponse", "ScriptQueue"]
@@ -0,0 +1,42 @@
+"""Shared fixtures for integration action tests."""
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+@pytest.fixture(autouse=True)
+def _git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provide commit identity through the environment.
+
+    Git reads GIT_AUTHOR_*/GIT_COMMITTER_* directly, so no per-repository
+    ``git config user.*`` subprocess calls are needed.
+    """
+    for key, value in _GIT_IDENTITY.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture(scope="session")
+def template_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build an initialised git repository once and share it across tests.
+
+    Tests copy the template into their own ``tmp_path`` instead of paying
+    for a ``git init`` subprocess each.
+    """
+    template = tmp_path_factory.mktemp("template") / "repo"
+    template.mkdir()
+    subprocess.run(("git", "init", "-q"), cwd=template, check=True)
+    return template
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from typing import TYPE_CHECKING
 
 from goapgit.actions.conflict import apply_path_strategy, auto_trivial_resolve
@@ -11,18 +12,11 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-_DEF_USER = ("git", "config", "user.email", "test@example.com")
-_DEF_NAME = ("git", "config", "user.name", "Test User")
-
-
-def _init_repo(tmp_path: Path) -> tuple[Path, GitFacade, StructuredLogger]:
+def _init_repo(tmp_path: Path, template_repo: Path) -> tuple[Path, GitFacade, StructuredLogger]:
     repo = tmp_path / "repo"
-    repo.mkdir()
-    logger = StructuredLogger(name="test")
+    shutil.copytree(template_repo, repo, symlinks=False)
+    logger = StructuredLogger.null()
     facade = GitFacade(repo_path=repo, logger=logger)
-    facade.run(["git", "init"])
-    facade.run(list(_DEF_USER))
-    facade.run(list(_DEF_NAME))
     return repo, facade, logger
 
 
@@ -53,9 +47,9 @@ def _seed_conflict_history(repo: Path, facade: GitFacade) -> None:
     assert merge_again.returncode != 0
 
 
-def test_auto_trivial_resolve_applies_rerere(tmp_path: Path) -> None:
+def test_auto_trivial_resolve_applies_rerere(tmp_path: Path, template_repo: Path) -> None:
     """Recorded rerere resolutions should be reapplied automatically."""
-    repo, facade, logger = _init_repo(tmp_path)
+    repo, facade, logger = _init_repo(tmp_path, template_repo)
     _seed_conflict_history(repo, facade)
 
     applied = auto_trivial_resolve(facade, logger)
@@ -65,9 +59,9 @@ def test_auto_trivial_resolve_applies_rerere(tmp_path: Path) -> None:
     assert diff.stdout.strip() == ""
 
 
-def test_apply_path_strategy_uses_theirs_for_lock(tmp_path: Path) -> None:
+def test_apply_path_strategy_uses_theirs_for_lock(tmp_path: Path, template_repo: Path) -> None:
     """Lock files should accept the incoming changes automatically."""
-    repo, facade, logger = _init_repo(tmp_path)
+    repo, facade, logger = _init_repo(tmp_path, template_repo)
     (repo / "dep.lock").write_text("base\n", encoding="utf-8")
     facade.run(["git", "add", "dep.lock"])
     facade.run(["git", "commit", "-m", "base"])
@@ -96,9 +90,9 @@ def test_apply_path_strategy_uses_theirs_for_lock(tmp_path: Path) -> None:
     assert "U" not in status.stdout
 
 
-def test_apply_path_strategy_prefers_ours_for_whitespace_markdown(tmp_path: Path) -> None:
+def test_apply_path_strategy_prefers_ours_for_whitespace_markdown(tmp_path: Path, template_repo: Path) -> None:
     """Whitespace-only markdown conflicts should keep the local content."""
-    repo, facade, logger = _init_repo(tmp_path)
+    repo, facade, logger = _init_repo(tmp_path, template_repo)
     (repo / "README.md").write_text("value=1\n", encoding="utf-8")
     facade.run(["git", "add", "README.md"])
     facade.run(["git", "commit", "-m", "base"])
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 from typing import TYPE_CHECKING
 
 import pytest
@@ -13,9 +12,9 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def _make_facade(path: Path, name: str) -> tuple[GitFacade, StructuredLogger]:
+def _make_facade(path: Path) -> tuple[GitFacade, StructuredLogger]:
     """Create a GitFacade with a dedicated structured logger."""
-    logger = StructuredLogger(name=name, stream=io.StringIO())
+    logger = StructuredLogger.null()
     return GitFacade(repo_path=path, logger=logger), logger
 
 
@@ -24,7 +23,7 @@ def test_explain_range_diff_logs_summary(tmp_path: Path) -> None:
     """Compute and persist a range-diff summary for a rebased branch."""
     repo = tmp_path / "repo"
     repo.mkdir()
-    facade, logger = _make_facade(repo, "git-quality")
+    facade, logger = _make_facade(repo)
     facade.run(["git", "init", "--initial-branch=main"])
     facade.run(["git", "config", "user.email", "quality@example.com"])
     facade.run(["git", "config", "user.name", "Quality User"])
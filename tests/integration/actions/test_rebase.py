@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from typing import TYPE_CHECKING
 
 from goapgit.actions.rebase import rebase_onto_upstream
@@ -10,23 +11,16 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-_DEF_USER = ("git", "config", "user.email", "test@example.com")
-_DEF_NAME = ("git", "config", "user.name", "Test User")
-
-
 def _append_line(path: Path, line: str) -> None:
     with path.open("a", encoding="utf-8") as stream:
         stream.write(line)
 
 
-def _setup_repo(tmp_path: Path) -> tuple[Path, GitFacade, StructuredLogger]:
+def _setup_repo(tmp_path: Path, template_repo: Path) -> tuple[Path, GitFacade, StructuredLogger]:
     repo = tmp_path / "repo"
-    repo.mkdir()
-    logger = StructuredLogger(name="test")
+    shutil.copytree(template_repo, repo, symlinks=False)
+    logger = StructuredLogger.null()
     facade = GitFacade(repo_path=repo, logger=logger)
-    facade.run(["git", "init"])
-    facade.run(list(_DEF_USER))
-    facade.run(list(_DEF_NAME))
     base_file = repo / "base.txt"
     base_file.write_text("base\n", encoding="utf-8")
     facade.run(["git", "add", "base.txt"])
@@ -35,9 +29,9 @@ def _setup_repo(tmp_path: Path) -> tuple[Path, GitFacade, StructuredLogger]:
     return repo, facade, logger
 
 
-def test_rebase_updates_stack_references(tmp_path: Path) -> None:
+def test_rebase_updates_stack_references(tmp_path: Path, template_repo: Path) -> None:
     """Rebasing with update-refs should rewrite stacked branch references."""
-    repo, facade, logger = _setup_repo(tmp_path)
+    repo, facade, logger = _setup_repo(tmp_path, template_repo)
 
     base_file = repo / "base.txt"
     _append_line(base_file, "main-1\n")
@@ -0,0 +1,17 @@
+"""Shared fixtures for the integration test tree."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_git_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point git at empty global/system config for every integration test.
+
+    This keeps real-git tests hermetic and avoids HOME contention when the
+    suite runs across pytest-xdist workers.
+    """
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+    monkeypatch.setenv("GIT_CONFIG_SYSTEM", os.devnull)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import io
 import os
-import shutil
+import subprocess
+import types
 from pathlib import Path
 
 import pytest
@@ -11,34 +11,48 @@ from goapgit.git.facade import GitFacade
 from goapgit.git.parse import predict_merge_conflicts
 from goapgit.io.logging import StructuredLogger
 
+_GIT_TEST_ENV = types.MappingProxyType(
+    {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+        "GIT_CONFIG_GLOBAL": os.devnull,
+        "GIT_CONFIG_SYSTEM": os.devnull,
+    },
+)
+
+_SETUP_SCRIPT = """
+set -e
+git init -q
+git checkout -q -b main
+printf 'base\\n' > file.txt
+git add file.txt
+git commit -q -m base
+git checkout -q -b feature
+printf 'feature\\n' > file.txt
+git commit -q -am feature
+git checkout -q main
+printf 'master\\n' > file.txt
+git commit -q -am master
+"""
+
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("git_executable")
 def test_merge_tree_prediction_matches_actual_merge(tmp_path: Path) -> None:
     """Ensure merge-tree predicted conflicts match a real merge attempt."""
-    if shutil.which("git") is None:
-        pytest.skip("git executable not available")
-
     repo_root = Path(tmp_path)
-    env = {**os.environ, "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com"}
-    env["GIT_COMMITTER_NAME"] = env["GIT_AUTHOR_NAME"]
-    env["GIT_COMMITTER_EMAIL"] = env["GIT_AUTHOR_EMAIL"]
-
-    logger = StructuredLogger(name="merge-tree-test", stream=io.StringIO())
-    facade = GitFacade(repo_root, logger, env={**env, "PATH": os.environ.get("PATH", "")})
-
-    facade.run(["git", "init", "-q"])
-    facade.run(["git", "checkout", "-q", "-b", "main"])
-    (repo_root / "file.txt").write_text("base\n", encoding="utf-8")
-    facade.run(["git", "add", "file.txt"])
-    facade.run(["git", "commit", "-q", "-m", "base"])
-
-    facade.run(["git", "checkout", "-q", "-b", "feature"])
-    (repo_root / "file.txt").write_text("feature\n", encoding="utf-8")
-    facade.run(["git", "commit", "-am", "feature"])
+    logger = StructuredLogger.null()
+    facade = GitFacade(repo_root, logger, env=_GIT_TEST_ENV)
 
-    facade.run(["git", "checkout", "-q", "main"])
-    (repo_root / "file.txt").write_text("master\n", encoding="utf-8")
-    facade.run(["git", "commit", "-am", "master"])
+    subprocess.run(
+        ("sh", "-c", _SETUP_SCRIPT),
+        cwd=repo_root,
+        env=_GIT_TEST_ENV,
+        check=True,
+    )
 
     predicted = predict_merge_conflicts(facade, "HEAD", "feature")
     assert predicted == {"file.txt"}
@@ -51,7 +65,7 @@ def test_merge_tree_prediction_matches_actual_merge(tmp_path: Path) -> None:
         capture_output=True,
     ).stdout.splitlines()
     actual_conflicts: set[str] = {
-        line.split()[-1] for line in status_output if line.startswith("u ")
+        line.rpartition(" ")[2] for line in status_output if line.startswith("u ")
     }
     assert predicted == actual_conflicts
 
@@ -2,31 +2,131 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import textwrap
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from typer.testing import CliRunner
 
 from goapgit.cli.main import app
 from goapgit.core.models import ConflictType
 
-from tests.conftest import GitResponse, ScriptQueue
+from tests.conftest import GitResponse, RepeatResponse, ScriptQueue
 
 if TYPE_CHECKING:
     from pathlib import Path
     import pytest
+    from click.testing import Result
 
 
-runner = CliRunner()
 STATUS_COMMAND = ("git", "status", "--porcelain=v2", "--branch", "--show-stash")
 PORCELAIN_COMMAND = ("git", "status", "--porcelain")
 
 
+_STATUS_FEATURE_AWESOME = textwrap.dedent(
+    """
+    # branch.oid deadbeefdeadbeefdeadbeefdeadbeefdeadbeef
+    # branch.head feature/awesome
+    # branch.upstream origin/feature/awesome
+    # branch.ab +2 -3
+    """,
+).strip()
+
+_JSON_CONFLICT_LINE = (
+    "1 UU N... 100644 100644 100644 100644 "
+    "deadbeefdeadbeefdeadbeefdeadbeefdeadbeef "
+    "cafebabecafebabecafebabecafebabecafebabe "
+    "abcdefabcdefabcdefabcdefabcdefabcdefabcd dashboard.json"
+)
+
+_STATUS_FEATURE_JSON = textwrap.dedent(
+    f"""
+    # branch.oid cafebabecafebabecafebabecafebabecafebabe
+    # branch.head feature/json
+    # branch.upstream origin/feature/json
+    # branch.ab +1 -1
+    {_JSON_CONFLICT_LINE}
+    """,
+).strip()
+
+_PLAN_JSON_CONFIG_TOML = textwrap.dedent(
+    """
+    [goal]
+    mode = "rebase_to_upstream"
+    tests_must_pass = true
+
+    [strategy]
+    enable_rerere = true
+    conflict_style = "zdiff3"
+    rules = [
+      { pattern = "**/*.lock", resolution = "theirs" },
+      { pattern = "**/*.json", resolution = "merge-driver:json", when = "whitespace_only" }
+    ]
+
+    [safety]
+    dry_run = true
+    allow_force_push = false
+    """,
+).strip()
+
+_LOCK_CONFLICT_LINE = (
+    "u UU N... 100644 100644 100644 100644 "
+    "1111111111111111111111111111111111111111 "
+    "2222222222222222222222222222222222222222 "
+    "3333333333333333333333333333333333333333 yarn.lock"
+)
+
+_STATUS_FEATURE_LOCKS = textwrap.dedent(
+    f"""
+    # branch.oid 0123456789abcdef0123456789abcdef01234567
+    # branch.head feature/locks
+    # branch.upstream origin/feature/locks
+    # branch.ab +3 -2
+    {_LOCK_CONFLICT_LINE}
+    """,
+).strip()
+
+_LOCK_CONFIG_TOML = textwrap.dedent(
+    """
+    [goal]
+    mode = "rebase_to_upstream"
+
+    [strategy]
+    enable_rerere = true
+    conflict_style = "zdiff3"
+    rules = [
+      { pattern = "**/*.lock", resolution = "theirs" }
+    ]
+
+    [safety]
+    dry_run = false
+    allow_force_push = false
+    """,
+).strip()
+
+
+@functools.cache
+def _runner() -> CliRunner:
+    """Return the shared CLI runner, constructed on first use."""
+    return CliRunner()
+
+
+@functools.cache
+def _split_runner() -> CliRunner:
+    """Return a CLI runner that keeps stdout and stderr separate."""
+    return CliRunner(mix_stderr=False)
+
+
 def _response(*, stdout: str = "", returncode: int = 0, stderr: str = "") -> GitResponse:
     return GitResponse(stdout=stdout, returncode=returncode, stderr=stderr)
 
 
+def _payload(result: Result) -> dict[str, Any]:
+    """Decode the JSON payload emitted by a CLI invocation."""
+    return json.loads(result.stdout)
+
+
 def test_plan_simple_text_output(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -34,21 +134,13 @@ def test_plan_simple_text_output(
 ) -> None:
     """A dry-run plan should list actions and heuristic cost in text mode."""
     monkeypatch.chdir(tmp_path)
-    status_output = textwrap.dedent(
-        """
-        # branch.oid deadbeefdeadbeefdeadbeefdeadbeefdeadbeef
-        # branch.head feature/awesome
-        # branch.upstream origin/feature/awesome
-        # branch.ab +2 -3
-        """,
-    ).strip()
     status_script: dict[tuple[str, ...], list[GitResponse] | GitResponse] = {
-        STATUS_COMMAND: [_response(stdout=status_output)],
+        STATUS_COMMAND: [_response(stdout=_STATUS_FEATURE_AWESOME)],
     }
     configure_fake_git_facade.push(status_script)
     configure_fake_git_facade.push({})
 
-    result = runner.invoke(app, ["plan"])
+    result = _runner().invoke(app, ["plan"])
 
     assert result.exit_code == 0
     assert f"Repository: {tmp_path}" in result.stdout
@@ -73,53 +165,17 @@ def test_plan_json_output_includes_conflict_metadata(
     conflict_file = tmp_path / "dashboard.json"
     conflict_file.write_text("<<<<<<< HEAD\n1\n=======\n2\n>>>>>>> theirs\n", encoding="utf-8")
     config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        textwrap.dedent(
-            """
-            [goal]
-            mode = "rebase_to_upstream"
-            tests_must_pass = true
-
-            [strategy]
-            enable_rerere = true
-            conflict_style = "zdiff3"
-            rules = [
-              { pattern = "**/*.lock", resolution = "theirs" },
-              { pattern = "**/*.json", resolution = "merge-driver:json", when = "whitespace_only" }
-            ]
-
-            [safety]
-            dry_run = true
-            allow_force_push = false
-            """,
-        ).strip(),
-        encoding="utf-8",
-    )
-    conflict_line = (
-        "1 UU N... 100644 100644 100644 100644 "
-        "deadbeefdeadbeefdeadbeefdeadbeefdeadbeef "
-        "cafebabecafebabecafebabecafebabecafebabe "
-        "abcdefabcdefabcdefabcdefabcdefabcdefabcd dashboard.json"
-    )
-    status_output = textwrap.dedent(
-        f"""
-        # branch.oid cafebabecafebabecafebabecafebabecafebabe
-        # branch.head feature/json
-        # branch.upstream origin/feature/json
-        # branch.ab +1 -1
-        {conflict_line}
-        """,
-    ).strip()
+    config_path.write_text(_PLAN_JSON_CONFIG_TOML, encoding="utf-8")
     status_script: dict[tuple[str, ...], list[GitResponse] | GitResponse] = {
-        STATUS_COMMAND: [_response(stdout=status_output)],
+        STATUS_COMMAND: [_response(stdout=_STATUS_FEATURE_JSON)],
     }
     configure_fake_git_facade.push(status_script)
     configure_fake_git_facade.push({})
 
-    result = runner.invoke(app, ["plan", "--json", "--config", str(config_path)])
+    result = _runner().invoke(app, ["plan", "--json", "--config", str(config_path)])
 
     assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = _payload(result)
     assert payload["repository"] == str(tmp_path)
     assert payload["state"]["conflicts"][0]["path"] == "dashboard.json"
     assert payload["state"]["conflicts"][0]["ctype"] == ConflictType.json.value
@@ -150,8 +206,7 @@ def test_plan_reports_git_command_failure(
     configure_fake_git_facade.push(status_script)
     configure_fake_git_facade.push({})
 
-    local_runner = CliRunner(mix_stderr=False)
-    result = local_runner.invoke(app, ["plan"])
+    result = _split_runner().invoke(app, ["plan"])
 
     assert result.exit_code == 1
     assert isinstance(result.exception, SystemExit)
@@ -173,47 +228,13 @@ def test_run_confirm_applies_lock_strategy(
     conflict_file = tmp_path / "yarn.lock"
     conflict_file.write_text("<<<<<<< HEAD\nlock\n=======\nlock\n>>>>>>> theirs\n", encoding="utf-8")
     config_path = tmp_path / "lock-config.toml"
-    config_path.write_text(
-        textwrap.dedent(
-            """
-            [goal]
-            mode = "rebase_to_upstream"
-
-            [strategy]
-            enable_rerere = true
-            conflict_style = "zdiff3"
-            rules = [
-              { pattern = "**/*.lock", resolution = "theirs" }
-            ]
-
-            [safety]
-            dry_run = false
-            allow_force_push = false
-            """,
-        ).strip(),
-        encoding="utf-8",
-    )
-    conflict_line = (
-        "u UU N... 100644 100644 100644 100644 "
-        "1111111111111111111111111111111111111111 "
-        "2222222222222222222222222222222222222222 "
-        "3333333333333333333333333333333333333333 yarn.lock"
-    )
-    status_output = textwrap.dedent(
-        f"""
-        # branch.oid 0123456789abcdef0123456789abcdef01234567
-        # branch.head feature/locks
-        # branch.upstream origin/feature/locks
-        # branch.ab +3 -2
-        {conflict_line}
-        """,
-    ).strip()
-    status_script: dict[tuple[str, ...], list[GitResponse] | GitResponse] = {
-        STATUS_COMMAND: [_response(stdout=status_output) for _ in range(5)],
+    config_path.write_text(_LOCK_CONFIG_TOML, encoding="utf-8")
+    status_script: dict[tuple[str, ...], list[GitResponse] | GitResponse | RepeatResponse] = {
+        STATUS_COMMAND: RepeatResponse(_response(stdout=_STATUS_FEATURE_LOCKS)),
     }
     configure_fake_git_facade.push(status_script)
     backup_ref = f"refs/backup/goap/{timestamp}"
-    action_script: dict[tuple[str, ...], list[GitResponse] | GitResponse] = {
+    action_script: dict[tuple[str, ...], list[GitResponse] | GitResponse | RepeatResponse] = {
         ("git", "rev-parse", "HEAD"): [_response(stdout="abc123\n")],
         ("git", "update-ref", backup_ref, "abc123"): [_response()],
         PORCELAIN_COMMAND: [
@@ -223,15 +244,15 @@ def test_run_confirm_applies_lock_strategy(
         ("git", "stash", "push", "--include-untracked", "-m", f"goap/{timestamp}"): [_response(stdout="Saved\n")],
         ("git", "config", "--bool", "rerere.enabled"): [_response(stdout="true\n")],
         ("git", "rerere"): [_response()],
-        ("git", "add", "--", "yarn.lock"): [_response(), _response()],
+        ("git", "add", "--", "yarn.lock"): RepeatResponse(_response()),
         ("git", "checkout", "--theirs", "--", "yarn.lock"): [_response()],
     }
     configure_fake_git_facade.push(action_script)
 
-    result = runner.invoke(app, ["run", "--confirm", "--json", "--config", str(config_path)])
+    result = _runner().invoke(app, ["run", "--confirm", "--json", "--config", str(config_path)])
 
     assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = _payload(result)
     assert payload["dry_run"] is False
     assert payload["initial_state"]["conflicts"][0]["ctype"] == ConflictType.lock.value
     executed_names = [action["name"] for action in payload["executed_actions"]]
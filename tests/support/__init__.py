@@ -0,0 +1 @@
+"""Shared helpers for the goapgit test suite."""
@@ -0,0 +1,23 @@
+"""Lightweight test doubles for git collaborators."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+
+class StubGitFacade:
+    """Hand-rolled stand-in for :class:`goapgit.git.facade.GitFacade`.
+
+    Only the methods the action helpers touch are provided, each backed
+    by a plain :class:`MagicMock` so tests keep the familiar
+    ``side_effect``/``assert_called_*`` APIs without paying for
+    ``create_autospec``'s full-class signature introspection.
+    """
+
+    def __init__(self) -> None:
+        """Create mocks for the facade methods used by actions."""
+        self.run = MagicMock(name="run")
+        self.rebase_continue = MagicMock(name="rebase_continue")
+        self.rebase_abort = MagicMock(name="rebase_abort")
+
+
+__all__ = ["StubGitFacade"]
@@ -0,0 +1,18 @@
+"""Validation-free helpers for deriving model fixtures."""
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def with_updates[ModelT: BaseModel](model: ModelT, **updates: Any) -> ModelT:
+    """Return a copy of ``model`` with ``updates`` applied, skipping validation.
+
+    The fixture values are known-valid, so ``model_construct`` avoids the
+    re-validation that ``model_copy(update=...)`` performs on every call.
+    """
+    return model.__class__.model_construct(**{**model.__dict__, **updates})
+
+
+__all__ = ["with_updates"]
@@ -1,25 +1,21 @@
 from __future__ import annotations
 
-import io
 import subprocess
 from dataclasses import dataclass
 from unittest.mock import call
 
 import pytest
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from pytest_mock import MockerFixture
 
 from goapgit.actions.conflict import apply_path_strategy, auto_trivial_resolve
-from goapgit.git.facade import GitFacade
 from goapgit.io.logging import StructuredLogger
 
+from tests.support.fakes import StubGitFacade
+
 
 @pytest.fixture
 def logger() -> StructuredLogger:
     """Return a structured logger backed by an in-memory stream."""
-    return StructuredLogger(name="test", stream=io.StringIO())
+    return StructuredLogger.null()
 
 
 def _completed(stdout: str = "", returncode: int = 0) -> subprocess.CompletedProcess[str]:
@@ -44,11 +40,10 @@ class StrategyRule:
 
 
 def test_auto_trivial_resolve_adds_separator_for_hyphen_prefixed_paths(
-    mocker: MockerFixture,
     logger: StructuredLogger,
 ) -> None:
     """Ensure git add is invoked with ``--`` before hyphenated paths."""
-    facade = mocker.create_autospec(GitFacade, instance=True)
+    facade = StubGitFacade()
 
     def run_side_effect(args: list[str], **_: object) -> subprocess.CompletedProcess[str]:
         command = tuple(args)
@@ -76,13 +71,12 @@ def test_auto_trivial_resolve_adds_separator_for_hyphen_prefixed_paths(
     [("theirs", "--theirs"), ("ours", "--ours")],
 )
 def test_apply_path_strategy_prefixes_separator_before_conflict_path(
-    mocker: MockerFixture,
     logger: StructuredLogger,
     resolution: str,
     checkout_flag: str,
 ) -> None:
     """Ensure checkout and add commands pass ``--`` before conflicted paths."""
-    facade = mocker.create_autospec(GitFacade, instance=True)
+    facade = StubGitFacade()
     facade.run.return_value = _completed()
     conflict = Conflict(path="-leading")
     rule = StrategyRule(pattern="*", resolution=resolution)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import io
+from collections import deque
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 
@@ -18,17 +18,17 @@ class FakeGitFacade:
 
     def __init__(self, responses: list[SimpleNamespace] | None = None) -> None:
         """Initialise the fake facade with an optional response sequence."""
-        self.commands: list[tuple[list[str], bool]] = []
-        self._responses = list(responses) if responses is not None else None
+        self.commands: list[tuple[tuple[str, ...], bool]] = []
+        self._responses = deque(responses) if responses is not None else None
 
     def run(self, command: list[str], *, check: bool = True, **_: object) -> SimpleNamespace:  # type: ignore[override]
         """Record the command and mimic a git invocation."""
-        self.commands.append((list(command), check))
+        self.commands.append((tuple(command), check))
         if self._responses is not None:
             if not self._responses:
                 msg = "No more fake responses configured"
                 raise AssertionError(msg)
-            response = self._responses.pop(0)
+            response = self._responses.popleft()
         else:
             response = SimpleNamespace(stdout="diff", stderr="", returncode=0)
         response.stdout = getattr(response, "stdout", "")
@@ -39,7 +39,7 @@ class FakeGitFacade:
 
 def _make_logger() -> StructuredLogger:
     """Create a structured logger backed by an in-memory buffer."""
-    return StructuredLogger(name="test-quality", stream=io.StringIO())
+    return StructuredLogger.null()
 
 
 def test_explain_range_diff_uses_separator_and_preserves_ranges() -> None:
@@ -52,7 +52,7 @@ def test_explain_range_diff_uses_separator_and_preserves_ranges() -> None:
     explain_range_diff(cast("GitFacade", facade), logger, before, after)
 
     assert facade.commands == [
-        (["git", "range-diff", "--", before, after], False),
+        (("git", "range-diff", "--", before, after), False),
     ]
 
 
@@ -84,6 +84,6 @@ def test_explain_range_diff_retries_without_separator_when_git_needs_ranges() ->
 
     assert summary == "range summary"
     assert facade.commands == [
-        (["git", "range-diff", "--", before, after], False),
-        (["git", "range-diff", before, after], False),
+        (("git", "range-diff", "--", before, after), False),
+        (("git", "range-diff", before, after), False),
     ]
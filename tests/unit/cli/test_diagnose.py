@@ -46,10 +46,19 @@ def init_repo(tmp_path: Path, git_env: dict[str, str]) -> Path:
     _ = git_env
     repo = tmp_path / "repo"
     repo.mkdir()
-    subprocess.run(("git", "init"), cwd=repo, check=True)
+    subprocess.run(("git", "init", "--quiet", "--initial-branch=main"), cwd=repo, check=True)
     return repo
 
 
+def _commit_file(repo: Path, name: str, message: str) -> None:
+    """Stage and commit a single file with one git subprocess."""
+    subprocess.run(
+        ("sh", "-c", f"git add {name} && git commit -q -m {message}"),
+        cwd=repo,
+        check=True,
+    )
+
+
 def test_generate_diagnosis_reports_recommendations(
     init_repo: Path,
     git_env: dict[str, str],
@@ -77,8 +86,7 @@ def test_large_repo_guidance_triggers(
 ) -> None:
     """Confirm guidance suggests sparse-checkout/worktree for large repos."""
     (init_repo / "file.txt").write_text("data", encoding="utf-8")
-    subprocess.run(("git", "add", "file.txt"), cwd=init_repo, check=True)
-    subprocess.run(("git", "commit", "-m", "initial"), cwd=init_repo, check=True)
+    _commit_file(init_repo, "file.txt", "initial")
 
     monkeypatch.setattr(diagnose, "TRACKED_FILE_THRESHOLD", 0)
     monkeypatch.setattr(diagnose, "SIZE_PACK_THRESHOLD_KIB", 0)
@@ -112,8 +120,7 @@ rebase = true
         encoding="utf-8",
     )
     (init_repo / "tracked.txt").write_text("payload", encoding="utf-8")
-    subprocess.run(("git", "add", "tracked.txt"), cwd=init_repo, check=True)
-    subprocess.run(("git", "commit", "-m", "tracked"), cwd=init_repo, check=True)
+    _commit_file(init_repo, "tracked.txt", "tracked")
 
     monkeypatch.chdir(init_repo)
 
@@ -3,35 +3,32 @@
 from __future__ import annotations
 
 import importlib
-import json
+import os
+from operator import attrgetter
+import shutil
 import subprocess
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
+from goapgit.cli.main import _build_plan_payload, _execute_workflow, _prepare_context
+from goapgit.cli.runtime import build_action_contexts
+from goapgit.core.explain import explain_plan
 
+# ``goapgit.cli`` re-exports a ``main`` *function*, which shadows the submodule
+# on attribute imports, so the module object has to come from import_module.
 cli_main = importlib.import_module("goapgit.cli.main")
 
+_RUNNER = CliRunner()
+_SPLIT_RUNNER = CliRunner(mix_stderr=False)
+
 if TYPE_CHECKING:
     from pathlib import Path
-    from goapgit.cli.main import PlanComputation
     from goapgit.cli.runtime import WorkflowContext
-    from collections.abc import Callable
-
-    WorkflowContextFactory = Callable[..., WorkflowContext]
-    PlanPayloadBuilder = Callable[[WorkflowContext], PlanComputation]
-else:
-    WorkflowContextFactory = object
-    PlanPayloadBuilder = object
 
 
-@pytest.fixture
-def git_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
-    """Prepare git identity and configuration for isolated repositories."""
-    config_file = tmp_path / "gitconfig"
-    config_file.write_text(
-        """
+_GITCONFIG = """
 [user]
     name = Test User
     email = test@example.com
@@ -39,43 +36,71 @@ def git_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
     conflictStyle = zdiff3
 [pull]
     rebase = true
-        """.strip()
-        + "\n",
-        encoding="utf-8",
-    )
+""".strip() + "\n"
 
-    env = {
-        "GIT_CONFIG_GLOBAL": str(config_file),
-        "GIT_AUTHOR_NAME": "Test User",
-        "GIT_AUTHOR_EMAIL": "test@example.com",
-        "GIT_COMMITTER_NAME": "Test User",
-        "GIT_COMMITTER_EMAIL": "test@example.com",
-    }
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+@pytest.fixture(scope="session")
+def session_gitconfig(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the shared git configuration file once per session."""
+    config_file = tmp_path_factory.mktemp("gitconfig") / "gitconfig"
+    config_file.write_text(_GITCONFIG, encoding="utf-8")
+    return config_file
+
+
+@pytest.fixture
+def git_env(session_gitconfig: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Prepare git identity and configuration for isolated repositories."""
+    env = {"GIT_CONFIG_GLOBAL": str(session_gitconfig), **_GIT_IDENTITY}
     for key, value in env.items():
         monkeypatch.setenv(key, value)
     return env
 
 
+@pytest.fixture(scope="session")
+def _template_repo(tmp_path_factory: pytest.TempPathFactory, session_gitconfig: Path) -> Path:
+    """Build the seeded repository once and share it across tests."""
+    repo = tmp_path_factory.mktemp("template") / "repo"
+    repo.mkdir()
+    env = {**os.environ, "GIT_CONFIG_GLOBAL": str(session_gitconfig), **_GIT_IDENTITY}
+    (repo / "README.md").write_text("seed", encoding="utf-8")
+    subprocess.run(
+        ("sh", "-c", "git init --quiet && git add README.md && git commit -q -m initial"),
+        cwd=repo,
+        check=True,
+        env=env,
+    )
+    return repo
+
+
 @pytest.fixture
-def init_repo(tmp_path: Path, git_env: dict[str, str]) -> Path:
-    """Create a git repository with an initial commit."""
+def init_repo(tmp_path: Path, git_env: dict[str, str], _template_repo: Path) -> Path:
+    """Copy the template repository into the test's own directory."""
     _ = git_env
     repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(("git", "init"), cwd=repo, check=True)
-    (repo / "README.md").write_text("seed", encoding="utf-8")
-    subprocess.run(("git", "add", "README.md"), cwd=repo, check=True)
-    subprocess.run(("git", "commit", "-m", "initial"), cwd=repo, check=True)
+    shutil.copytree(_template_repo, repo, symlinks=False)
     return repo
 
 
+def _dry_run_context(repo: Path) -> WorkflowContext:
+    """Build a silenced dry-run workflow context for ``repo``."""
+    return _prepare_context(repo, None, json_logs=True, dry_run_actions=True, silence_logs=True)
+
+
 def test_plan_command_outputs_json(init_repo: Path) -> None:
-    """Ensure the plan command provides structured JSON output."""
-    runner = CliRunner()
-    result = runner.invoke(cli_main.app, ["plan", "--repo", str(init_repo), "--json"])
-    assert result.exit_code == 0, result.stderr
+    """Ensure the plan payload serialises with actions and branch data."""
+    computation = _build_plan_payload(_dry_run_context(init_repo))
 
-    payload = json.loads(result.stdout)
+    payload = {
+        "plan": computation.plan.model_dump(mode="json"),
+        "state": computation.state.model_dump(mode="json"),
+    }
     assert payload["plan"]["actions"], "plan should contain at least one action"
     assert payload["state"]["ref"]["branch"], "branch name must be reported"
 
@@ -88,8 +113,7 @@ def test_plan_command_reports_validation_error(tmp_path: Path) -> None:
 mode = "invalid"
 """.strip(), encoding="utf-8")
 
-    runner = CliRunner(mix_stderr=False)
-    result = runner.invoke(cli_main.app, ["plan", "--config", str(config_path)])
+    result = _SPLIT_RUNNER.invoke(cli_main.app, ["plan", "--config", str(config_path)])
 
     assert result.exit_code == 2
     assert "Invalid configuration" in result.stderr
@@ -102,65 +126,52 @@ def test_plan_command_reports_value_error_for_bad_path(tmp_path: Path) -> None:
     config_dir = tmp_path / "config_dir"
     config_dir.mkdir()
 
-    runner = CliRunner(mix_stderr=False)
-    result = runner.invoke(cli_main.app, ["plan", "--config", str(config_dir)])
+    result = _SPLIT_RUNNER.invoke(cli_main.app, ["plan", "--config", str(config_dir)])
 
     assert result.exit_code == 2
     assert "not a file" in result.stderr
     assert str(config_dir) in result.stderr
 
 
+def _has_backup_ref(repo: Path) -> bool:
+    """Check for refs/backup/goap entries by reading the ref files directly."""
+    backup_dir = repo / ".git" / "refs" / "backup" / "goap"
+    if backup_dir.is_dir() and any(entry.is_file() for entry in backup_dir.rglob("*")):
+        return True
+    packed = repo / ".git" / "packed-refs"
+    return packed.is_file() and "refs/backup/goap" in packed.read_text(encoding="utf-8")
+
+
 def test_run_command_without_confirm_is_dry(init_repo: Path) -> None:
     """The run command without --confirm must not create backup refs."""
-    runner = CliRunner()
-    result = runner.invoke(cli_main.app, ["run", "--repo", str(init_repo)])
+    result = _RUNNER.invoke(cli_main.app, ["run", "--repo", str(init_repo)])
     assert result.exit_code == 0, result.stderr
 
-    refs = subprocess.run(
-        ("git", "show-ref"),
-        cwd=init_repo,
-        check=False,
-        capture_output=True,
-        text=True,
-    ).stdout
-    assert "refs/backup/goap" not in refs
+    assert not _has_backup_ref(init_repo)
 
 
 def test_run_command_with_confirm_creates_backup(init_repo: Path) -> None:
     """When --confirm is provided a backup ref should be created."""
-    runner = CliRunner()
-    result = runner.invoke(cli_main.app, ["run", "--repo", str(init_repo), "--confirm"])
+    result = _RUNNER.invoke(cli_main.app, ["run", "--repo", str(init_repo), "--confirm"])
     assert result.exit_code == 0, result.stderr
 
-    refs = subprocess.run(
-        ("git", "show-ref"),
-        cwd=init_repo,
-        check=False,
-        capture_output=True,
-        text=True,
-    ).stdout
-    assert "refs/backup/goap" in refs
+    assert _has_backup_ref(init_repo)
 
 
 def test_explain_command_lists_reasons(init_repo: Path) -> None:
-    """Explain command should provide rationale for each action."""
-    runner = CliRunner()
-    result = runner.invoke(cli_main.app, ["explain", "--repo", str(init_repo), "--json"])
-    assert result.exit_code == 0, result.stderr
+    """Explain helpers should provide rationale for each planned action."""
+    context = _dry_run_context(init_repo)
+    computation = _build_plan_payload(context)
 
-    payload = json.loads(result.stdout)
-    explanations = payload["explanations"]
+    explanations = explain_plan(computation.plan, contexts=build_action_contexts(context.config))
     assert explanations, "explanations should not be empty"
-    assert all(entry["reason"] for entry in explanations)
+    assert all(map(attrgetter("reason"), explanations))
 
 
 def test_dry_run_command_reports_history(init_repo: Path) -> None:
-    """Dry-run command must report the simulated git command history."""
-    runner = CliRunner()
-    result = runner.invoke(cli_main.app, ["dry-run", "--repo", str(init_repo), "--json"])
-    assert result.exit_code == 0, result.stderr
+    """Dry-run execution must report the simulated git command history."""
+    payload = _execute_workflow(_dry_run_context(init_repo))
 
-    payload = json.loads(result.stdout)
     assert payload["dry_run"] is True
     assert payload["command_history"], "dry-run should record command history"
 
@@ -190,8 +201,7 @@ def test_dry_run_command_escapes_control_sequences(monkeypatch: pytest.MonkeyPat
     monkeypatch.setattr(cli_main, "_prepare_context", fake_prepare_context)
     monkeypatch.setattr(cli_main, "_execute_workflow", fake_execute_workflow)
 
-    runner = CliRunner()
-    result = runner.invoke(cli_main.app, ["dry-run"])
+    result = _RUNNER.invoke(cli_main.app, ["dry-run"])
 
     assert result.exit_code == 0, result.stderr
     assert "\\x1b" in result.stdout
@@ -200,21 +210,7 @@ def test_dry_run_command_escapes_control_sequences(monkeypatch: pytest.MonkeyPat
 
 def test_build_plan_payload_returns_expected_sections(init_repo: Path) -> None:
     """Ensure the shared helper reports state, actions, and plans."""
-    prepare_context = cast("WorkflowContextFactory",
-        object.__getattribute__(cli_main, "_prepare_context"),
-    )
-    build_plan_payload = cast("PlanPayloadBuilder",
-        object.__getattribute__(cli_main, "_build_plan_payload"),
-    )
-
-    context = prepare_context(
-        repo=init_repo,
-        config_path=None,
-        json_logs=True,
-        dry_run_actions=True,
-        silence_logs=True,
-    )
-    computation = build_plan_payload(context)
+    computation = _build_plan_payload(_dry_run_context(init_repo))
 
     assert computation.state.ref.branch
     assert computation.actions, "actions catalogue should not be empty"
@@ -0,0 +1,56 @@
+"""Tests for the repository state cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from goapgit.core import RepoRef, RepoState, RepoStateCache, RiskLevel
+
+
+def _make_state() -> RepoState:
+    """Return a minimal repository state for cache tests."""
+    return RepoState(
+        repo_path=Path("/repo"),
+        ref=RepoRef(branch="main"),
+        conflicts=(),
+        conflict_difficulty=0.0,
+        diverged_local=0,
+        diverged_remote=0,
+        staleness_score=0.0,
+        risk_level=RiskLevel.low,
+    )
+
+
+def test_get_observes_once_until_invalidated() -> None:
+    """Repeated reads should reuse a single observation."""
+    calls = 0
+
+    def observer() -> RepoState:
+        nonlocal calls
+        calls += 1
+        return _make_state()
+
+    cache = RepoStateCache(observer)
+
+    first = cache.get()
+    second = cache.get()
+
+    assert calls == 1
+    assert first is second
+
+
+def test_invalidate_triggers_fresh_observation() -> None:
+    """Invalidation should force the next read to observe again."""
+    calls = 0
+
+    def observer() -> RepoState:
+        nonlocal calls
+        calls += 1
+        return _make_state()
+
+    cache = RepoStateCache(observer)
+    cache.get()
+    cache.invalidate()
+    cache.get()
+
+    assert calls == 2
@@ -20,9 +20,10 @@ from goapgit.core import (
     SimplePlanner,
 )
 from goapgit.core.models import ConflictDetail
+from tests.support.models import with_updates
 
 if TYPE_CHECKING:  # pragma: no cover - typing helpers only
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable
 
 
 @pytest.fixture
@@ -58,67 +59,54 @@ def goal() -> GoalSpec:
 
 def _observer_from_states(states: list[RepoState]) -> Callable[[], RepoState]:
     """Create an observer that yields repository states sequentially."""
-    iterator: Iterator[RepoState] = iter(states)
+    last_index = len(states) - 1
+    cursor = [0]
 
     def _observer() -> RepoState:
-        try:
-            return next(iterator)
-        except StopIteration:  # pragma: no cover - defensive guard
-            return states[-1]
+        index = cursor[0]
+        cursor[0] = min(index + 1, last_index)
+        return states[index]
 
     return _observer
 
 
-def test_executor_completes_without_replan(
-    base_state: RepoState,
-    goal: GoalSpec,
-    sample_actions: list[ActionSpec],
-) -> None:
-    """Executor finishes when actions succeed and observations remain steady."""
-    planner = SimplePlanner(weights=HeuristicWeights())
-    observer_states = [base_state] * len(sample_actions)
-
-    def runner_success(action: ActionSpec) -> bool:
-        del action
-        return True
-
-    executor = Executor(
-        planner=planner,
-        observer=_observer_from_states(observer_states),
-        runner=runner_success,
-        available_actions=sample_actions,
-        goal=goal,
+def _with_conflict(state: RepoState) -> RepoState:
+    """Derive a state whose observation reports an unresolved conflict."""
+    return with_updates(
+        state,
+        conflicts=(ConflictDetail(path="file.txt", hunk_count=1, trivial_ratio=0.0),),
+        conflict_difficulty=2.0,
     )
 
-    plan = planner.plan(base_state, goal, sample_actions)
-    result = executor.execute(base_state, plan)
 
-    assert isinstance(result, ExecutionResult)
-    assert not result.replanned
-    assert len(result.executed_actions) == len(plan.actions)
+def _with_divergence(state: RepoState) -> RepoState:
+    """Derive a state whose observation diverges from the expectation."""
+    return with_updates(state, diverged_local=2)
 
 
-def test_executor_replans_on_action_failure(
+@pytest.mark.parametrize(
+    ("observe", "runner_result", "expect_replan"),
+    [
+        pytest.param(lambda state: state, True, False, id="steady-success"),
+        pytest.param(_with_conflict, False, True, id="action-failure"),
+        pytest.param(_with_divergence, True, True, id="observation-divergence"),
+    ],
+)
+def test_executor_behavior(
     base_state: RepoState,
     goal: GoalSpec,
     sample_actions: list[ActionSpec],
+    observe: Callable[[RepoState], RepoState],
+    runner_result: bool,
+    expect_replan: bool,
 ) -> None:
-    """The executor triggers replanning when an action fails."""
+    """Executor finishes on steady success and replans on failure or divergence."""
     planner = SimplePlanner(weights=HeuristicWeights())
-    failed_state = base_state.model_copy(
-        update={
-            "conflicts": (
-                ConflictDetail(path="file.txt", hunk_count=1, trivial_ratio=0.0),
-            ),
-            "conflict_difficulty": 2.0,
-        },
-    )
-
-    observer_states = [failed_state]
+    observer_states = [observe(base_state)]
 
     def runner(action: ActionSpec) -> bool:
         del action
-        return False
+        return runner_result
 
     executor = Executor(
         planner=planner,
@@ -131,35 +119,10 @@ def test_executor_replans_on_action_failure(
     initial_plan = planner.plan(base_state, goal, sample_actions)
     result = executor.execute(base_state, initial_plan)
 
-    assert result.replanned
-    assert len(result.executed_actions) == 0
-    assert result.final_plan != initial_plan
-
-
-def test_executor_replans_when_observation_diverges(
-    base_state: RepoState,
-    goal: GoalSpec,
-    sample_actions: list[ActionSpec],
-) -> None:
-    """The executor requests a new plan when observations diverge."""
-    planner = SimplePlanner(weights=HeuristicWeights())
-    diverged_state = base_state.model_copy(update={"diverged_local": 2})
-    observer_states = [diverged_state]
-
-    def runner_success(action: ActionSpec) -> bool:
-        del action
-        return True
-
-    executor = Executor(
-        planner=planner,
-        observer=_observer_from_states(observer_states),
-        runner=runner_success,
-        available_actions=sample_actions,
-        goal=goal,
-    )
-
-    initial_plan = planner.plan(base_state, goal, sample_actions)
-    result = executor.execute(base_state, initial_plan)
-
-    assert result.replanned
-    assert len(result.executed_actions) == 0
+    assert isinstance(result, ExecutionResult)
+    assert result.replanned is expect_replan
+    if expect_replan:
+        assert len(result.executed_actions) == 0
+        assert result.final_plan != initial_plan
+    else:
+        assert len(result.executed_actions) == len(initial_plan.actions)
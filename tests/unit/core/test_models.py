@@ -4,7 +4,7 @@ import pathlib
 
 import pytest
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from goapgit.core.models import (
     ActionSpec,
@@ -18,6 +18,9 @@ from goapgit.core.models import (
     RiskLevel,
 )
 
+_REPO_STATE_ADAPTER = TypeAdapter(RepoState)
+_PLAN_ADAPTER = TypeAdapter(Plan)
+
 
 @pytest.fixture
 def sample_repo_state() -> RepoState:
@@ -63,15 +66,15 @@ def sample_plan() -> Plan:
 
 def test_repo_state_json_round_trip(sample_repo_state: RepoState) -> None:
     """RepoState should serialize and deserialize without loss."""
-    dumped = sample_repo_state.model_dump_json()
-    reloaded = RepoState.model_validate_json(dumped)
+    dumped = _REPO_STATE_ADAPTER.dump_json(sample_repo_state)
+    reloaded = _REPO_STATE_ADAPTER.validate_json(dumped)
     assert reloaded == sample_repo_state
 
 
 def test_plan_json_round_trip(sample_plan: Plan) -> None:
     """Plan should maintain equality across JSON round trips."""
-    dumped = sample_plan.model_dump_json()
-    reloaded = Plan.model_validate_json(dumped)
+    dumped = _PLAN_ADAPTER.dump_json(sample_plan)
+    reloaded = _PLAN_ADAPTER.validate_json(dumped)
     assert reloaded == sample_plan
 
 
@@ -18,6 +18,7 @@ from goapgit.core import (
     heuristic_score,
 )
 from goapgit.core.models import ConflictDetail
+from tests.support.models import with_updates
 
 
 @pytest.fixture
@@ -39,21 +40,13 @@ def test_heuristic_increases_with_conflicts_and_divergence(base_state: RepoState
     """Ensure the heuristic grows monotonically with increasing risk factors."""
     weights = HeuristicWeights(alpha=1.0, beta=1.0, gamma=1.0, delta=1.0)
 
-    state_with_conflict = base_state.model_copy(
-        update={
-            "conflicts": (
-                ConflictDetail(path="file.txt", hunk_count=2, trivial_ratio=0.1),
-            ),
-            "conflict_difficulty": 3.0,
-        },
+    state_with_conflict = with_updates(
+        base_state,
+        conflicts=(ConflictDetail(path="file.txt", hunk_count=2, trivial_ratio=0.1),),
+        conflict_difficulty=3.0,
     )
-    state_with_divergence = state_with_conflict.model_copy(
-        update={
-            "diverged_local": 2,
-            "diverged_remote": 1,
-        },
-    )
-    state_high_risk = state_with_divergence.model_copy(update={"risk_level": RiskLevel.high})
+    state_with_divergence = with_updates(state_with_conflict, diverged_local=2, diverged_remote=1)
+    state_high_risk = with_updates(state_with_divergence, risk_level=RiskLevel.high)
 
     baseline = heuristic_score(base_state, weights)
     conflict_score = heuristic_score(state_with_conflict, weights)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import subprocess
 from pathlib import Path
 
@@ -9,11 +8,13 @@ import pytest
 from goapgit.git.facade import GitCommandError, GitFacade
 from goapgit.io.logging import StructuredLogger
 
+_OK_RESULT = subprocess.CompletedProcess((), 0, stdout="", stderr="")
+
 
 @pytest.fixture
 def logger() -> StructuredLogger:
     """Provide a structured logger backed by an in-memory stream."""
-    return StructuredLogger(name="test", stream=io.StringIO())
+    return StructuredLogger.null()
 
 
 @pytest.fixture
@@ -85,7 +86,7 @@ def test_fetch_invokes_git_fetch(
 
     def fake_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
         calls.append((list(args), dict(kwargs)))
-        return subprocess.CompletedProcess(tuple(args), 0, stdout="", stderr="")
+        return _OK_RESULT
 
     monkeypatch.setattr(facade, "run", fake_run)
     facade.fetch("origin", extra_args=["--atomic"])
@@ -100,7 +101,7 @@ def test_rebase_with_options(
 
     def fake_run(args: list[str], **_: object) -> subprocess.CompletedProcess[str]:
         calls.append(list(args))
-        return subprocess.CompletedProcess(tuple(args), 0, stdout="", stderr="")
+        return _OK_RESULT
 
     monkeypatch.setattr(facade, "run", fake_run)
     facade.rebase("feature", onto="main", opts=["--update-refs"])
@@ -115,7 +116,7 @@ def test_rebase_continue_and_abort(
 
     def fake_run(args: list[str], **_: object) -> subprocess.CompletedProcess[str]:
         calls.append(list(args))
-        return subprocess.CompletedProcess(tuple(args), 0, stdout="", stderr="")
+        return _OK_RESULT
 
     monkeypatch.setattr(facade, "run", fake_run)
     facade.rebase_continue()
@@ -131,7 +132,7 @@ def test_push_with_lease(
 
     def fake_run(args: list[str], **_: object) -> subprocess.CompletedProcess[str]:
         calls.append(list(args))
-        return subprocess.CompletedProcess(tuple(args), 0, stdout="", stderr="")
+        return _OK_RESULT
 
     monkeypatch.setattr(facade, "run", fake_run)
     facade.push_with_lease("origin", ["HEAD:main"], extra_args=["--atomic"], force=True)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import subprocess
 import textwrap
 from pathlib import Path
@@ -12,26 +11,50 @@ from goapgit.git.facade import GitFacade
 from goapgit.git.observe import RepoObserver
 from goapgit.io.logging import StructuredLogger
 
+_STATUS_CLEAN = textwrap.dedent(
+    """
+    # branch.oid deadbeefdeadbeefdeadbeefdeadbeefdeadbeef
+    # branch.head main
+    # branch.upstream origin/main
+    # branch.ab +0 -0
+    # stash 2
+    """,
+).strip()
+
+_STATUS_DIVERGED = textwrap.dedent(
+    """
+    # branch.oid cafe0000cafe0000cafe0000cafe0000cafe0000
+    # branch.head feature
+    # branch.upstream origin/feature
+    # branch.ab +2 -1
+    1 M. N... 100644 100644 100644 100644 dead dead tracked.txt
+    ? newfile.txt
+    """,
+).strip()
+
+_STATUS_CONFLICTS = textwrap.dedent(
+    """
+    # branch.oid feed0000feed0000feed0000feed0000feed0000
+    # branch.head feature
+    # branch.upstream origin/feature
+    # branch.ab +0 -3
+    # rebase-merge
+    u UU N... 100644 100644 100644 100644 sha1 sha2 sha3 conflict.json
+    """,
+).strip()
+
 
 @pytest.fixture
 def logger() -> StructuredLogger:
     """Provide a structured logger instance for tests."""
-    return StructuredLogger(name="observer-test", stream=io.StringIO())
+    return StructuredLogger.null()
 
 
 def test_observe_clean_repository(
     tmp_path: Path, logger: StructuredLogger, monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Create a clean RepoState from porcelain output."""
-    output = textwrap.dedent(
-        """
-        # branch.oid deadbeefdeadbeefdeadbeefdeadbeefdeadbeef
-        # branch.head main
-        # branch.upstream origin/main
-        # branch.ab +0 -0
-        # stash 2
-        """,
-    ).strip()
+    output = _STATUS_CLEAN
     workspace = Path(tmp_path)
     facade = GitFacade(workspace, logger)
 
@@ -65,16 +88,7 @@ def test_observe_with_local_changes(
     tmp_path: Path, logger: StructuredLogger, monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Detect staged changes and divergence markers."""
-    output = textwrap.dedent(
-        """
-        # branch.oid cafe0000cafe0000cafe0000cafe0000cafe0000
-        # branch.head feature
-        # branch.upstream origin/feature
-        # branch.ab +2 -1
-        1 M. N... 100644 100644 100644 100644 dead dead tracked.txt
-        ? newfile.txt
-        """,
-    ).strip()
+    output = _STATUS_DIVERGED
     workspace = Path(tmp_path)
     facade = GitFacade(workspace, logger)
 
@@ -100,16 +114,7 @@ def test_observe_detects_conflicts(
     tmp_path: Path, logger: StructuredLogger, monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Identify conflicts and classify them via the parser hook."""
-    output = textwrap.dedent(
-        """
-        # branch.oid feed0000feed0000feed0000feed0000feed0000
-        # branch.head feature
-        # branch.upstream origin/feature
-        # branch.ab +0 -3
-        # rebase-merge
-        u UU N... 100644 100644 100644 100644 sha1 sha2 sha3 conflict.json
-        """,
-    ).strip()
+    output = _STATUS_CONFLICTS
     recorded_paths: list[str] = []
 
     workspace = Path(tmp_path)
@@ -10,30 +10,49 @@ if TYPE_CHECKING:
 from goapgit.core.models import ConflictType
 from goapgit.git.parse import parse_conflict_markers, parse_merge_tree_conflicts
 
+_CONFLICT_JSON_BYTES = textwrap.dedent(
+    """
+    <<<<<<< ours
+    value: 1
+    ||||||| base
+    value: 0
+    =======
+    value: 2
+    >>>>>>> theirs
+    <<<<<<< ours
+    other
+    =======
+    other theirs
+    >>>>>>> theirs
+    """,
+).strip().encode("utf-8")
+
+_CONFLICT_YAML_BYTES = textwrap.dedent(
+    """
+    <<<<<<< ours
+    =======
+    >>>>>>> theirs
+    """,
+).strip().encode("utf-8")
+
+_MERGE_TREE_OUT = textwrap.dedent(
+    """
+    751a4a450175b6ad2f8b86f0eed4b213927fc999
+    100644 df967b96a579e45a18b8251732d16804b2e56a55 1       file.txt
+
+    Auto-merging file.txt
+    CONFLICT (content): Merge conflict in file.txt
+    Auto-merging nested/path.json
+    CONFLICT (content): Merge conflict in nested/path.json
+    """,
+).strip()
+
 
 def test_parse_conflict_markers_counts_hunks(tmp_path: Path) -> None:
     """Parse a JSON conflict file and count zdiff3 hunks."""
     workspace = Path(tmp_path)
     conflict_file = workspace / "conflict.json"
-    conflict_file.write_text(
-        textwrap.dedent(
-            """
-            <<<<<<< ours
-            value: 1
-            ||||||| base
-            value: 0
-            =======
-            value: 2
-            >>>>>>> theirs
-            <<<<<<< ours
-            other
-            =======
-            other theirs
-            >>>>>>> theirs
-            """,
-        ).strip(),
-        encoding="utf-8",
-    )
+    conflict_file.write_bytes(_CONFLICT_JSON_BYTES)
 
     detail = parse_conflict_markers(workspace, "conflict.json")
 
@@ -45,16 +64,7 @@ def test_parse_conflict_markers_yaml_type(tmp_path: Path) -> None:
     """Detect YAML conflict file type."""
     workspace = Path(tmp_path)
     conflict_file = workspace / "conflict.yaml"
-    conflict_file.write_text(
-        textwrap.dedent(
-            """
-            <<<<<<< ours
-            =======
-            >>>>>>> theirs
-            """,
-        ).strip(),
-        encoding="utf-8",
-    )
+    conflict_file.write_bytes(_CONFLICT_YAML_BYTES)
 
     detail = parse_conflict_markers(workspace, "conflict.yaml")
 
@@ -64,17 +74,7 @@ def test_parse_conflict_markers_yaml_type(tmp_path: Path) -> None:
 
 def test_parse_merge_tree_conflicts_extracts_paths() -> None:
     """Extract conflicting paths from merge-tree output."""
-    output = textwrap.dedent(
-        """
-        751a4a450175b6ad2f8b86f0eed4b213927fc999
-        100644 df967b96a579e45a18b8251732d16804b2e56a55 1       file.txt
-
-        Auto-merging file.txt
-        CONFLICT (content): Merge conflict in file.txt
-        Auto-merging nested/path.json
-        CONFLICT (content): Merge conflict in nested/path.json
-        """,
-    ).strip()
+    output = _MERGE_TREE_OUT
 
     conflicts = parse_merge_tree_conflicts(output)
 
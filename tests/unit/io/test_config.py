@@ -30,12 +30,17 @@ max_test_runtime_sec = 120
 """
 
 
-def test_load_config_from_path(tmp_path: pathlib.Path) -> None:
-    """Loading from disk should produce a validated Config instance."""
-    config_path = pathlib.Path(tmp_path / "goapgit.toml")
+@pytest.fixture(scope="session")
+def sample_config_path(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Write the sample configuration once for every non-mutating test."""
+    config_path = tmp_path_factory.mktemp("config") / "goapgit.toml"
     config_path.write_text(SAMPLE_TOML)
+    return config_path
 
-    config = load_config(path=config_path)
+
+def test_load_config_from_path(sample_config_path: pathlib.Path) -> None:
+    """Loading from disk should produce a validated Config instance."""
+    config = load_config(path=sample_config_path)
 
     assert isinstance(config, Config)
     assert config.goal.push_with_lease is True
@@ -43,12 +48,9 @@ def test_load_config_from_path(tmp_path: pathlib.Path) -> None:
     assert config.dry_run is False
 
 
-def test_load_config_with_overrides(tmp_path: pathlib.Path) -> None:
+def test_load_config_with_overrides(sample_config_path: pathlib.Path) -> None:
     """Overrides should merge into the loaded configuration."""
-    config_path = pathlib.Path(tmp_path / "goapgit.toml")
-    config_path.write_text(SAMPLE_TOML)
-
-    config = load_config(path=config_path, overrides={"safety": {"dry_run": True}})
+    config = load_config(path=sample_config_path, overrides={"safety": {"dry_run": True}})
 
     assert config.dry_run is True
 
@@ -86,14 +88,14 @@ def test_unreadable_config_path_raises_value_error(
     config_path = tmp_path / "goapgit.toml"
     config_path.write_text(SAMPLE_TOML)
 
-    original_read_text = pathlib.Path.read_text
+    original_read_bytes = pathlib.Path.read_bytes
 
-    def fake_read_text(self: pathlib.Path, *args: Any, **kwargs: Any) -> str:
+    def fake_read_bytes(self: pathlib.Path, *args: Any, **kwargs: Any) -> bytes:
         if self == config_path:
             raise PermissionError("Permission denied")
-        return original_read_text(self, *args, **kwargs)
+        return original_read_bytes(self, *args, **kwargs)
 
-    monkeypatch.setattr(pathlib.Path, "read_text", fake_read_text)
+    monkeypatch.setattr(pathlib.Path, "read_bytes", fake_read_bytes)
 
     with pytest.raises(ValueError, match=str(config_path)):
         load_config(path=config_path)